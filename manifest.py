@@ -0,0 +1,31 @@
+# MicroPython freeze manifest for the Waveshare ESP32-S3 PhotoPainter drivers.
+#
+# Include this file from a board manifest, e.g.
+#     include("$(PORT_DIR)/boards/manifest.py")
+#     include("path/to/this/repo/manifest.py")
+# Don't pass it alone as FROZEN_MANIFEST: that replaces the board manifest,
+# and the firmware loses _boot.py/inisetup and no longer mounts the
+# filesystem. The driver package and the examples are compiled with
+# mpy-cross at build time and imported from flash, so nothing is parsed on
+# the device at import.
+
+package(
+    "waveshare_photopainter",
+    files=(
+        "__init__.py",
+        "config.py",
+        "drivers/__init__.py",
+        "drivers/ed2208_gca.py",
+    ),
+    opt=3,
+)
+
+# Examples are frozen as top-level modules, so `import basic_demo` works.
+for name in (
+    "basic_demo.py",
+    "advanced_graphics.py",
+    "image_display.py",
+    "pmic_demo.py",
+    "quick_start.py",
+):
+    module(name, base_path="waveshare_photopainter/examples", opt=3)
@@ -20,7 +20,7 @@ Usage:
     pmic.init()
     
     # Initialize display
-    spi = SPI(1, baudrate=4000000, polarity=0, phase=0,
+    spi = SPI(1, baudrate=10000000, polarity=0, phase=0,
               sck=Pin(12), mosi=Pin(11))
     epd = ED2208_GCA(spi, Pin(10), Pin(9), Pin(8), Pin(7))
     
@@ -29,7 +29,10 @@ class DefaultPins:
     I2C_SDA = 17    # I2C Data
     
     # SPI Configuration
-    SPI_BAUDRATE = 4000000  # 4 MHz
+    # The IL3895-class controller's minimum SCL write cycle is 100 ns, so
+    # 10 MHz is the ceiling. The bus is write-only, so an over-fast clock
+    # would fail silently rather than report an error.
+    SPI_BAUDRATE = 10000000  # 10 MHz
     SPI_POLARITY = 0
     SPI_PHASE = 0
     SPI_BITS = 8
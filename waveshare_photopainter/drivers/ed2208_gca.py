@@ -12,10 +12,13 @@ License: MIT
 from micropython import const
 from time import sleep_ms
 import framebuf
+import micropython
 
 # Display resolution
 EPD_WIDTH = const(250)
 EPD_HEIGHT = const(122)
+EPD_WIDTH_BYTES = const((EPD_WIDTH + 7) // 8)   # bytes per row (rows padded to whole bytes)
+EPD_BUFSZ = const(EPD_WIDTH_BYTES * EPD_HEIGHT)  # framebuffer size in bytes
 
 # Display commands
 DRIVER_OUTPUT_CONTROL = const(0x01)
@@ -41,6 +44,18 @@ SET_RAM_Y_ADDRESS_COUNTER = const(0x4F)
 TERMINATE_FRAME_READ_WRITE = const(0xFF)
 
 
+@micropython.viper
+def _fast_fill(buf: ptr32, words: int, val: int):
+    """Fill a word-aligned buffer with a 32-bit value, 4 words per step."""
+    i = 0
+    while i < words:
+        buf[i] = val
+        buf[i + 1] = val
+        buf[i + 2] = val
+        buf[i + 3] = val
+        i += 4
+
+
 class ED2208_GCA:
     """
     Driver for ED2208-GCA E-Paper Display
@@ -49,6 +64,31 @@ class ED2208_GCA:
     ED2208-GCA black and white e-paper display.
     """
     
+    # Init register sequence as (command, data) pairs
+    _INIT_SEQ = (
+        (DRIVER_OUTPUT_CONTROL, b'\x79\x00\x00'),     # EPD_HEIGHT - 1, GD/SM/TB = 0
+        (BOOSTER_SOFT_START_CONTROL, b'\xD7\xD6\x9D'),
+        (WRITE_VCOM_REGISTER, b'\xA8'),
+        (SET_DUMMY_LINE_PERIOD, b'\x1A'),
+        (SET_GATE_TIME, b'\x08'),
+        (DATA_ENTRY_MODE_SETTING, b'\x03'),            # X increment, Y increment
+    )
+    
+    # Full-refresh waveform LUT (30 bytes), written by init() and restored by
+    # display() after a partial update has replaced the LUT in the controller
+    _FULL_LUT = (
+        b'\x22\x55\xAA\x55\xAA\x55\xAA\x11\x00\x00'
+        b'\x00\x00\x00\x00\x00\x00\x1E\x1E\x1E\x1E'
+        b'\x1E\x1E\x1E\x1E\x01\x00\x00\x00\x00\x00'
+    )
+    
+    # Partial-refresh waveform LUT (30 bytes) used by partial_display()
+    _PARTIAL_LUT = (
+        b'\x10\x18\x18\x08\x18\x18\x08\x00\x00\x00'
+        b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+        b'\x13\x14\x44\x12\x00\x00\x00\x00\x00\x00'
+    )
+    
     def __init__(self, spi, cs, dc, rst, busy):
         """
         Initialize the ED2208-GCA display driver.
@@ -66,6 +106,12 @@ class ED2208_GCA:
         self.rst = rst
         self.busy = busy
         
+        # Bound methods cached for the SPI/GPIO hot path
+        self._w = spi.write
+        self._cs = cs.value
+        self._dc = dc.value
+        self._busy = busy.value
+        
         self.width = EPD_WIDTH
         self.height = EPD_HEIGHT
         
@@ -74,36 +120,102 @@ class ED2208_GCA:
         self.dc.value(0)
         self.rst.value(0)
         
-        # Create framebuffer (1 bit per pixel for black/white)
-        self.buffer = bytearray(self.height * self.width // 8)
-        self.fb = framebuf.FrameBuffer(self.buffer, self.width, self.height, framebuf.MONO_HLSB)
+        # Last level driven on DC, and whether CS is held by _begin_txn()
+        self._dc_state = 0
+        self._in_txn = False
+        
+        # Set once partial_display() has written _PARTIAL_LUT. The 0xC7 update
+        # sequence leaves the LUT-load bit (0x10) clear, so the partial LUT
+        # stays in use until display() writes _FULL_LUT back.
+        self._partial_lut = False
+        
+        # Create framebuffer (1 bit per pixel for black/white). Rows are
+        # padded to EPD_WIDTH_BYTES, so the last 6 bits of each row are unused.
+        self.buffer = bytearray(EPD_BUFSZ)
+        self.fb = framebuf.FrameBuffer(self.buffer, self.width, self.height,
+                                       framebuf.MONO_HLSB, EPD_WIDTH_BYTES * 8)
+        # Zero-copy view of the framebuffer for row slices
+        self._mv = memoryview(self.buffer)
+        
+        # Preallocated 1-byte buffer for single-byte SPI writes
+        self._cmd_buf = bytearray(1)
+        
+        # Preallocated 2- and 4-byte buffers for RAM address parameters
+        self._addr_buf2 = bytearray(2)
+        self._addr_buf4 = bytearray(4)
+        
+        # Reusable row buffer streamed by clear() (one row of display RAM)
+        self._clear_row = bytearray(EPD_WIDTH_BYTES)
         
         # Initialize the display
         self.init()
     
-    def _spi_write(self, data):
-        """Write data to SPI bus."""
-        self.cs(0)
-        self.spi.write(bytearray(data))
-        self.cs(1)
+    def _begin_txn(self):
+        """Assert CS and keep it low across a burst of commands and data."""
+        self._cs(0)
+        self._in_txn = True
+    
+    def _end_txn(self):
+        """Release CS at the end of a burst started with _begin_txn()."""
+        self._in_txn = False
+        self._cs(1)
     
     def _send_command(self, command):
         """Send command to display."""
-        self.dc(0)
-        self._spi_write([command])
-    
-    def _send_data(self, data):
-        """Send data to display."""
-        self.dc(1)
-        if isinstance(data, int):
-            self._spi_write([data])
+        if self._dc_state != 0:
+            self._dc(0)
+            self._dc_state = 0
+        self._cmd_buf[0] = command
+        if self._in_txn:
+            self._w(self._cmd_buf)
+        else:
+            self._cs(0)
+            self._w(self._cmd_buf)
+            self._cs(1)
+    
+    def _send_data_byte(self, data):
+        """Send a single data byte to display."""
+        if self._dc_state != 1:
+            self._dc(1)
+            self._dc_state = 1
+        self._cmd_buf[0] = data
+        if self._in_txn:
+            self._w(self._cmd_buf)
         else:
-            self._spi_write(data)
+            self._cs(0)
+            self._w(self._cmd_buf)
+            self._cs(1)
+    
+    def _send_data_buf(self, data):
+        """Send a bytes-like data buffer to display (written without copying)."""
+        if self._dc_state != 1:
+            self._dc(1)
+            self._dc_state = 1
+        if self._in_txn:
+            self._w(data)
+        else:
+            self._cs(0)
+            self._w(data)
+            self._cs(1)
+    
+    def _send_seq(self, seq):
+        """Send a sequence of (command, data) pairs."""
+        for command, data in seq:
+            self._send_command(command)
+            self._send_data_buf(data)
     
     def _wait_until_idle(self):
         """Wait until the display is idle (busy pin goes low)."""
-        while self.busy.value() == 1:
-            sleep_ms(10)
+        # Spin briefly so short waits (e.g. after SW reset) return promptly
+        for _ in range(100):
+            if not self._busy():
+                return
+        
+        # Then poll with a doubling delay, capped at 20 ms
+        delay = 1
+        while self._busy():
+            sleep_ms(delay)
+            delay = min(delay * 2, 20)
     
     def reset(self):
         """Hardware reset the display."""
@@ -123,64 +235,50 @@ class ED2208_GCA:
         self._send_command(SW_RESET)
         self._wait_until_idle()
         
-        # Driver output control
-        self._send_command(DRIVER_OUTPUT_CONTROL)
-        self._send_data((EPD_HEIGHT - 1) & 0xFF)
-        self._send_data(((EPD_HEIGHT - 1) >> 8) & 0xFF)
-        self._send_data(0x00)
-        
-        # Booster soft start control
-        self._send_command(BOOSTER_SOFT_START_CONTROL)
-        self._send_data(0xD7)
-        self._send_data(0xD6)
-        self._send_data(0x9D)
-        
-        # Write VCOM register
-        self._send_command(WRITE_VCOM_REGISTER)
-        self._send_data(0xA8)
-        
-        # Set dummy line period
-        self._send_command(SET_DUMMY_LINE_PERIOD)
-        self._send_data(0x1A)
-        
-        # Set gate time
-        self._send_command(SET_GATE_TIME)
-        self._send_data(0x08)
-        
-        # Data entry mode
-        self._send_command(DATA_ENTRY_MODE_SETTING)
-        self._send_data(0x03)
-        
-        # Set RAM address
-        self._set_memory_area(0, 0, self.width - 1, self.height - 1)
-        self._set_memory_pointer(0, 0)
+        # Register configuration, sent with CS held low for the whole burst
+        self._begin_txn()
+        try:
+            self._send_seq(self._INIT_SEQ)
+            self._send_command(WRITE_LUT_REGISTER)
+            self._send_data_buf(self._FULL_LUT)
+            self._set_memory_area(0, 0, self.width - 1, self.height - 1)
+            self._set_memory_pointer(0, 0)
+        finally:
+            self._end_txn()
+        self._partial_lut = False
         
         self._wait_until_idle()
     
     def _set_memory_area(self, x_start, y_start, x_end, y_end):
         """Set the memory area for drawing."""
         # Set RAM X address
+        buf = self._addr_buf2
+        buf[0] = x_start >> 3
+        buf[1] = x_end >> 3
         self._send_command(SET_RAM_X_ADDRESS_START_END_POSITION)
-        self._send_data(x_start // 8)
-        self._send_data(x_end // 8)
+        self._send_data_buf(buf)
         
         # Set RAM Y address
+        buf = self._addr_buf4
+        buf[0] = y_start & 0xFF
+        buf[1] = (y_start >> 8) & 0xFF
+        buf[2] = y_end & 0xFF
+        buf[3] = (y_end >> 8) & 0xFF
         self._send_command(SET_RAM_Y_ADDRESS_START_END_POSITION)
-        self._send_data(y_start & 0xFF)
-        self._send_data((y_start >> 8) & 0xFF)
-        self._send_data(y_end & 0xFF)
-        self._send_data((y_end >> 8) & 0xFF)
+        self._send_data_buf(buf)
     
     def _set_memory_pointer(self, x, y):
         """Set the memory pointer for drawing."""
         # Set RAM X address counter
         self._send_command(SET_RAM_X_ADDRESS_COUNTER)
-        self._send_data(x // 8)
+        self._send_data_byte(x >> 3)
         
         # Set RAM Y address counter
+        buf = self._addr_buf2
+        buf[0] = y & 0xFF
+        buf[1] = (y >> 8) & 0xFF
         self._send_command(SET_RAM_Y_ADDRESS_COUNTER)
-        self._send_data(y & 0xFF)
-        self._send_data((y >> 8) & 0xFF)
+        self._send_data_buf(buf)
     
     def clear(self, color=0xFF):
         """
@@ -193,27 +291,120 @@ class ED2208_GCA:
         self._set_memory_pointer(0, 0)
         
         self._send_command(WRITE_RAM)
-        # Send clear data in one buffer for efficiency
-        clear_buffer = bytearray([color] * (self.width // 8 * self.height))
-        self._send_data(clear_buffer)
+        # Stream the same row buffer for every line instead of allocating
+        # a full-frame buffer; only refill it when the color changes
+        row = self._clear_row
+        if row[0] != color:
+            for i in range(len(row)):
+                row[i] = color
+        if self._dc_state != 1:
+            self._dc(1)
+            self._dc_state = 1
+        self._cs(0)
+        for _ in range(EPD_HEIGHT):
+            self._w(row)
+        self._cs(1)
         
         # Also clear framebuffer
         if color == 0xFF:
-            self.fb.fill(0)
+            self.fill(0)
         else:
-            self.fb.fill(1)
+            self.fill(1)
     
     def display(self):
-        """Update the display with the framebuffer content."""
+        """
+        Update the display with the framebuffer content.
+        
+        Blocks until the panel deasserts BUSY, so the refresh has finished
+        when this returns. If partial_display() has been used, the full
+        waveform LUT is written back first.
+        """
+        if self._partial_lut:
+            self._send_command(WRITE_LUT_REGISTER)
+            self._send_data_buf(self._FULL_LUT)
+            self._partial_lut = False
+        
         self._set_memory_area(0, 0, self.width - 1, self.height - 1)
         self._set_memory_pointer(0, 0)
         
         self._send_command(WRITE_RAM)
-        self._send_data(self.buffer)
+        self._send_data_buf(self.buffer)
         
         # Display update sequence
         self._send_command(DISPLAY_UPDATE_CONTROL_2)
-        self._send_data(0xC7)
+        self._send_data_byte(0xC7)
+        self._send_command(MASTER_ACTIVATION)
+        self._send_command(TERMINATE_FRAME_READ_WRITE)
+        
+        self._wait_until_idle()
+    
+    def display_then_wait_ms(self, visible_ms):
+        """
+        Update the display, then keep the image up for visible_ms.
+        
+        The delay starts once the refresh has finished (BUSY deasserted),
+        so the image is visible for the full time regardless of how long
+        the waveform took.
+        """
+        self.display()
+        sleep_ms(visible_ms)
+    
+    def partial_display(self, x, y, w, h):
+        """
+        Update only a window of the display with the framebuffer content.
+        
+        Only the rows of the window are sent over SPI and the panel runs the
+        shorter partial-refresh waveform, which is written to the LUT register
+        only when it is not already loaded. Repeated partial updates can leave
+        some ghosting; call display() for a full refresh, which writes the
+        full-refresh LUT back first. Like display(), this blocks until BUSY is
+        deasserted.
+        
+        Args:
+            x, y: Top-left corner of the window
+            w, h: Width and height of the window in pixels
+        """
+        # Clip the window to the panel
+        if x < 0:
+            w += x
+            x = 0
+        if y < 0:
+            h += y
+            y = 0
+        w = min(w, self.width - x)
+        h = min(h, self.height - y)
+        if w <= 0 or h <= 0:
+            return
+        x_end = x + w - 1
+        y_end = y + h - 1
+        
+        if not self._partial_lut:
+            self._send_command(WRITE_LUT_REGISTER)
+            self._send_data_buf(self._PARTIAL_LUT)
+            self._partial_lut = True
+        
+        self._set_memory_area(x, y, x_end, y_end)
+        self._set_memory_pointer(x, y)
+        
+        # RAM X addresses are whole bytes, so send the byte columns that
+        # cover the window from each row
+        self._send_command(WRITE_RAM)
+        mv = self._mv
+        start = y * EPD_WIDTH_BYTES + (x >> 3)
+        end = y * EPD_WIDTH_BYTES + (x_end >> 3) + 1
+        self._begin_txn()
+        try:
+            for _ in range(h):
+                self._send_data_buf(mv[start:end])
+                start += EPD_WIDTH_BYTES
+                end += EPD_WIDTH_BYTES
+        finally:
+            self._end_txn()
+        
+        # Same update sequence as display(), including charge pump and
+        # oscillator power-down; only the LUT in use differs
+        self._send_command(DISPLAY_UPDATE_CONTROL_2)
+        self._send_data_byte(0xC7)
         self._send_command(MASTER_ACTIVATION)
         self._send_command(TERMINATE_FRAME_READ_WRITE)
         
@@ -222,12 +413,13 @@ class ED2208_GCA:
     def sleep(self):
         """Put the display into deep sleep mode."""
         self._send_command(DEEP_SLEEP_MODE)
-        self._send_data(0x01)
+        self._send_data_byte(0x01)
     
     # Drawing methods (using framebuffer)
     def fill(self, color):
         """Fill the entire display with a color."""
-        self.fb.fill(color)
+        # EPD_BUFSZ (3904) is a multiple of 16, as _fast_fill requires
+        _fast_fill(self.buffer, EPD_BUFSZ >> 2, 0 if color == 0 else -1)
     
     def pixel(self, x, y, color):
         """Set a pixel at (x, y) to the specified color."""
@@ -256,6 +448,13 @@ class ED2208_GCA:
         """Draw text at (x, y)."""
         self.fb.text(s, x, y, color)
     
+    def text_lines(self, lines, x, y, color=1, line_height=10):
+        """Draw several lines of text, starting at (x, y), line_height apart."""
+        text = self.fb.text
+        for s in lines:
+            text(s, x, y, color)
+            y += line_height
+    
     def blit(self, fbuf, x, y, key=-1, palette=None):
         """Blit another framebuffer to this one."""
         self.fb.blit(fbuf, x, y, key, palette)
@@ -300,11 +499,14 @@ class AXP2101:
         self.i2c = i2c
         self.addr = addr
         
-        # Check if device is present
-        try:
-            self._read_reg(AXP2101_STATUS)
-        except OSError:
-            raise RuntimeError("AXP2101 not found at address 0x{:02X}".format(addr))
+        # Cached register values for _set_bit/_clear_bit, keyed by address
+        self._shadow = {}
+        
+        # Preallocated buffer for single-byte register writes
+        self._wbuf = bytearray(1)
+        
+        # Reusable buffer for read_status_block()
+        self._status_buf = bytearray(2)
     
     def _read_reg(self, reg, nbytes=1):
         """Read one or more bytes from a register."""
@@ -313,19 +515,27 @@ class AXP2101:
     def _write_reg(self, reg, data):
         """Write one or more bytes to a register."""
         if isinstance(data, int):
-            data = bytes([data])
+            self._wbuf[0] = data
+            data = self._wbuf
         self.i2c.writeto_mem(self.addr, reg, data)
     
+    def _shadow_reg(self, reg):
+        """Return the cached value of a register, reading it on first use."""
+        val = self._shadow.get(reg)
+        if val is None:
+            val = self._read_reg(reg)[0]
+        return val
+    
     def _set_bit(self, reg, bit):
         """Set a specific bit in a register."""
-        val = self._read_reg(reg)[0]
-        val |= (1 << bit)
+        val = self._shadow_reg(reg) | (1 << bit)
+        self._shadow[reg] = val
         self._write_reg(reg, val)
     
     def _clear_bit(self, reg, bit):
         """Clear a specific bit in a register."""
-        val = self._read_reg(reg)[0]
-        val &= ~(1 << bit)
+        val = self._shadow_reg(reg) & ~(1 << bit)
+        self._shadow[reg] = val
         self._write_reg(reg, val)
     
     def init(self):
@@ -334,21 +544,28 @@ class AXP2101:
         
         This sets up power rails, charging parameters, and enables necessary
         LDOs for the display and other peripherals.
-        """
-        # Enable DCDC1 (3.3V for system)
-        self._set_bit(AXP2101_DC_ONOFF_DVM, 0)
         
-        # Enable DCDC2 (for ESP32-S3 core)
-        self._set_bit(AXP2101_DC_ONOFF_DVM, 1)
-        
-        # Enable DCDC3 (for peripherals)
-        self._set_bit(AXP2101_DC_ONOFF_DVM, 2)
+        The enable registers are written directly rather than read-modify-
+        written: DC_ONOFF_DVM is set to 0x07 (DCDC1-3) and LDO_ONOFF_SET to
+        0x03 (ALDO1-2), clearing the other enable bits in those registers.
+        No other registers are touched.
         
-        # Enable ALDO1 for e-paper display (typically 3.3V)
-        self._set_bit(AXP2101_LDO_ONOFF_SET, 0)
+        Raises:
+            RuntimeError: If the AXP2101 does not respond at self.addr
+        """
+        # Enable DCDC1 (3.3V for system), DCDC2 (for ESP32-S3 core) and
+        # DCDC3 (for peripherals). This is the first bus access, so it
+        # doubles as the presence check.
+        try:
+            self._write_reg(AXP2101_DC_ONOFF_DVM, 0x07)
+        except OSError:
+            raise RuntimeError("AXP2101 not found at address 0x{:02X}".format(self.addr))
+        self._shadow[AXP2101_DC_ONOFF_DVM] = 0x07
         
-        # Enable ALDO2 for additional peripherals
-        self._set_bit(AXP2101_LDO_ONOFF_SET, 1)
+        # Enable ALDO1 for e-paper display (typically 3.3V) and ALDO2 for
+        # additional peripherals
+        self._write_reg(AXP2101_LDO_ONOFF_SET, 0x03)
+        self._shadow[AXP2101_LDO_ONOFF_SET] = 0x03
         
         # Small delay for power stabilization
         sleep_ms(10)
@@ -404,6 +621,18 @@ class AXP2101:
         """
         return self._read_reg(AXP2101_MODE_CHGSTATUS)[0]
     
+    def read_status_block(self):
+        """
+        Read the status and charging status registers in one I2C transfer.
+        
+        Returns:
+            2-byte buffer: [0] is the status byte (as get_status()) and [1]
+            the charging status byte (as get_charging_status()). The same
+            buffer is reused and overwritten by the next call.
+        """
+        self.i2c.readfrom_mem_into(self.addr, AXP2101_STATUS, self._status_buf)
+        return self._status_buf
+    
     def is_charging(self):
         """
         Check if battery is currently charging.
@@ -434,9 +663,9 @@ class AXP2101:
     
     def clear_irq(self):
         """Clear all interrupt flags."""
-        # Clear IRQ status registers
-        self._write_reg(AXP2101_IRQ_STATUS1, 0xFF)
-        self._write_reg(AXP2101_IRQ_STATUS1 + 1, 0xFF)
+        # Clear both IRQ status registers in one burst (register address
+        # auto-increments)
+        self._write_reg(AXP2101_IRQ_STATUS1, b'\xFF\xFF')
     
     def enable_adc(self):
         """Enable ADC channels for voltage/current monitoring."""
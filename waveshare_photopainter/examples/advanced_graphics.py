@@ -6,32 +6,58 @@ drawing complex shapes and patterns.
 """
 
 from machine import Pin, SPI
-from drivers.ed2208_gca import ED2208_GCA
+from waveshare_photopainter.drivers.ed2208_gca import ED2208_GCA, EPD_WIDTH_BYTES
 from time import sleep
+from micropython import const
+import framebuf
+import micropython
 
 # Pin configuration
-SPI_SCK = 12
-SPI_MOSI = 11
-CS_PIN = 10
-DC_PIN = 9
-RST_PIN = 8
-BUSY_PIN = 7
+SPI_SCK = const(12)
+SPI_MOSI = const(11)
+CS_PIN = const(10)
+DC_PIN = const(9)
+RST_PIN = const(8)
+BUSY_PIN = const(7)
 
-def draw_circle(epd, x0, y0, radius, color):
-    """Draw a circle using midpoint circle algorithm."""
-    x = radius
+# SPI clock for the display (matches DefaultPins.SPI_BAUDRATE in config.py)
+SPI_BAUDRATE = const(10000000)  # 10 MHz (100 ns minimum SCL write cycle)
+
+# Pre-rendered background grid, built on first use by _grid_pattern()
+_grid = None
+
+@micropython.viper
+def _circle_viper(buf: ptr8, stride: int, w: int, h: int,
+                  x0: int, y0: int, r: int, color: int):
+    """Midpoint circle written directly into a MONO_HLSB buffer."""
+    x = r
     y = 0
     err = 0
     
     while x >= y:
-        epd.pixel(x0 + x, y0 + y, color)
-        epd.pixel(x0 + y, y0 + x, color)
-        epd.pixel(x0 - y, y0 + x, color)
-        epd.pixel(x0 - x, y0 + y, color)
-        epd.pixel(x0 - x, y0 - y, color)
-        epd.pixel(x0 - y, y0 - x, color)
-        epd.pixel(x0 + y, y0 - x, color)
-        epd.pixel(x0 + x, y0 - y, color)
+        # Plot the 8 symmetric points: bit 2 swaps x/y, bits 0/1 flip signs
+        k = 0
+        while k < 8:
+            if k & 4:
+                px = y
+                py = x
+            else:
+                px = x
+                py = y
+            if k & 1:
+                px = 0 - px
+            if k & 2:
+                py = 0 - py
+            px += x0
+            py += y0
+            if px >= 0 and px < w and py >= 0 and py < h:
+                idx = py * stride + (px >> 3)
+                mask = 0x80 >> (px & 7)
+                if color:
+                    buf[idx] = buf[idx] | mask
+                else:
+                    buf[idx] = buf[idx] & (0xFF ^ mask)
+            k += 1
         
         if err <= 0:
             y += 1
@@ -41,17 +67,29 @@ def draw_circle(epd, x0, y0, radius, color):
             x -= 1
             err -= 2*x + 1
 
+def draw_circle(epd, x0, y0, radius, color):
+    """Draw a circle using midpoint circle algorithm."""
+    # epd.buffer rows are EPD_WIDTH_BYTES long (padded to whole bytes)
+    _circle_viper(epd.buffer, EPD_WIDTH_BYTES, epd.width, epd.height,
+                  x0, y0, radius, color)
+
+def _grid_pattern(epd):
+    """Return the grid background as a buffer laid out like epd.buffer."""
+    global _grid
+    if _grid is None:
+        _grid = bytearray(len(epd.buffer))
+        fb = framebuf.FrameBuffer(_grid, epd.width, epd.height,
+                                  framebuf.MONO_HLSB, EPD_WIDTH_BYTES * 8)
+        for x in range(0, epd.width, 20):
+            fb.vline(x, 0, epd.height, 1)
+        for y in range(0, epd.height, 20):
+            fb.hline(0, y, epd.width, 1)
+    return _grid
+
 def draw_pattern(epd):
     """Draw an interesting pattern."""
-    # Clear display
-    epd.fill(0)
-    
-    # Draw grid pattern
-    for x in range(0, epd.width, 20):
-        epd.vline(x, 0, epd.height, 1)
-    
-    for y in range(0, epd.height, 20):
-        epd.hline(0, y, epd.width, 1)
+    # Clear display and draw grid pattern with a single buffer copy
+    epd.buffer[:] = _grid_pattern(epd)
     
     # Draw circles
     draw_circle(epd, 125, 61, 30, 1)
@@ -62,16 +100,23 @@ def draw_pattern(epd):
 
 def draw_animation_frames(epd):
     """Draw a series of frames showing movement."""
+    last_x = None
     for i in range(0, epd.width - 40, 20):
         epd.fill(0)
         epd.text("Moving ->", i, 50, 1)
         epd.rect(i, 40, 40, 20, 1)
-        epd.display()
+        if last_x is None:
+            epd.display()
+        else:
+            # Refresh only the strip covering the previous and current
+            # box and label ("Moving ->" is 9 chars * 8 px = 72 px wide)
+            epd.partial_display(last_x, 40, i + 72 - last_x, 20)
+        last_x = i
         sleep(1)
 
 def main():
     # Initialize hardware
-    spi = SPI(1, baudrate=4000000, polarity=0, phase=0,
+    spi = SPI(1, baudrate=SPI_BAUDRATE, polarity=0, phase=0,
               sck=Pin(SPI_SCK), mosi=Pin(SPI_MOSI))
     
     cs = Pin(CS_PIN, Pin.OUT)
@@ -95,9 +140,7 @@ def main():
     # Final message
     epd.fill(0)
     epd.text("Demo Complete!", 50, 50, 1)
-    epd.display()
-    
-    sleep(2)
+    epd.display_then_wait_ms(2000)
     epd.sleep()
     print("Done!")
 
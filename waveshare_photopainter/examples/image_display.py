@@ -5,102 +5,107 @@ This example shows how to display images on the e-paper display.
 Images should be converted to 1-bit (black and white) format.
 """
 
-from machine import Pin, SPI
-from drivers.ed2208_gca import ED2208_GCA
+from waveshare_photopainter.config import create_display
 import framebuf
-from time import sleep
+import micropython
 
-# Pin configuration
-SPI_SCK = 12
-SPI_MOSI = 11
-CS_PIN = 10
-DC_PIN = 9
-RST_PIN = 8
-BUSY_PIN = 7
+# Example 16x16 smiley face icon (1-bit bitmap). A bytes literal avoids
+# building a temporary list at import and stays in flash when frozen.
+SMILEY_ICON = (
+    b'\x00\x00'
+    b'\x0f\xf0'
+    b'\x3f\xfc'
+    b'\x7f\xfe'
+    b'\x73\xce'
+    b'\xe3\xc7'
+    b'\xe3\xc7'
+    b'\xe3\xc7'
+    b'\xe3\xc7'
+    b'\xff\xff'
+    b'\x79\x9e'
+    b'\x79\x9e'
+    b'\x7f\xfe'
+    b'\x3f\xfc'
+    b'\x0f\xf0'
+    b'\x00\x00'
+)
 
-# Example 16x16 smiley face icon (1-bit bitmap)
-SMILEY_ICON = bytearray([
-    0b00000000, 0b00000000,
-    0b00001111, 0b11110000,
-    0b00111111, 0b11111100,
-    0b01111111, 0b11111110,
-    0b01110011, 0b11001110,
-    0b11100011, 0b11000111,
-    0b11100011, 0b11000111,
-    0b11100011, 0b11000111,
-    0b11100011, 0b11000111,
-    0b11111111, 0b11111111,
-    0b01111001, 0b10011110,
-    0b01111001, 0b10011110,
-    0b01111111, 0b11111110,
-    0b00111111, 0b11111100,
-    0b00001111, 0b11110000,
-    0b00000000, 0b00000000,
-])
+# Framebuffer for the icon, built once and reused for every blit
+# (FrameBuffer needs a writable buffer, so it gets its own copy)
+SMILEY_FB = framebuf.FrameBuffer(bytearray(SMILEY_ICON), 16, 16, framebuf.MONO_HLSB)
 
-def display_icon(epd, icon_data, width, height, x, y):
-    """Display a bitmap icon on the display."""
-    # Create a framebuffer for the icon
-    icon_fb = framebuf.FrameBuffer(icon_data, width, height, framebuf.MONO_HLSB)
-    
-    # Blit the icon to the display
+# Size of the checkerboard test pattern (MONO_HLSB rows are padded to 7 bytes)
+PATTERN_SIZE = 50
+PATTERN_ROW_BYTES = (PATTERN_SIZE + 7) // 8
+PATTERN_BLOCK = 10  # checkerboard square size in pixels
+
+def display_icon(epd, icon_fb, x, y):
+    """Display a bitmap icon (a prebuilt FrameBuffer) on the display."""
     epd.blit(icon_fb, x, y)
 
-def create_simple_image():
-    """Create a simple test pattern."""
-    # Create a 50x50 checkerboard pattern
-    width, height = 50, 50
-    buffer = bytearray((width * height) // 8)
-    fb = framebuf.FrameBuffer(buffer, width, height, framebuf.MONO_HLSB)
+@micropython.viper
+def _fill_checker(buf: ptr8, width: int, height: int, block: int):
+    """Draw a checkerboard of block x block squares into a MONO_HLSB buffer."""
+    row_bytes = (width + 7) >> 3
+    y = 0
+    while y < height:
+        row = y * row_bytes
+        x = 0
+        while x < width:
+            # The top-left square is filled; squares alternate along both axes
+            idx = row + (x >> 3)
+            mask = 0x80 >> (x & 7)
+            if ((x // block) + (y // block)) & 1 == 0:
+                buf[idx] = buf[idx] | mask
+            else:
+                buf[idx] = buf[idx] & (0xFF ^ mask)
+            x += 1
+        y += 1
+
+def create_simple_image(buffer):
+    """
+    Draw a simple test pattern into a caller-supplied buffer.
     
-    # Draw checkerboard
-    for y in range(0, height, 10):
-        for x in range(0, width, 10):
-            if (x // 10 + y // 10) % 2 == 0:
-                fb.fill_rect(x, y, 10, 10, 1)
+    The buffer must hold PATTERN_ROW_BYTES * PATTERN_SIZE bytes.
+    Returns the pattern (width, height).
+    """
+    # Draw a 50x50 checkerboard pattern
+    width = height = PATTERN_SIZE
+    _fill_checker(buffer, width, height, PATTERN_BLOCK)
     
-    return buffer, width, height
+    return width, height
 
 def main():
-    # Initialize hardware
-    spi = SPI(1, baudrate=4000000, polarity=0, phase=0,
-              sck=Pin(SPI_SCK), mosi=Pin(SPI_MOSI))
-    
-    cs = Pin(CS_PIN, Pin.OUT)
-    dc = Pin(DC_PIN, Pin.OUT)
-    rst = Pin(RST_PIN, Pin.OUT)
-    busy = Pin(BUSY_PIN, Pin.IN)
-    
-    # Initialize display
+    # Initialize display with the shared default SPI and pin configuration
     print("Initializing display...")
-    epd = ED2208_GCA(spi, cs, dc, rst, busy)
+    epd = create_display()
     
     # Clear and display title
     epd.fill(0)
-    epd.text("Image Display", 10, 10, 1)
-    epd.text("Demo", 10, 25, 1)
+    epd.text_lines(("Image Display", "Demo"), 10, 10, 1, 15)
     
     # Display smiley icons at different positions
     print("Displaying icons...")
-    display_icon(epd, SMILEY_ICON, 16, 16, 10, 50)
-    display_icon(epd, SMILEY_ICON, 16, 16, 50, 50)
-    display_icon(epd, SMILEY_ICON, 16, 16, 90, 50)
-    display_icon(epd, SMILEY_ICON, 16, 16, 130, 50)
+    display_icon(epd, SMILEY_FB, 10, 50)
+    display_icon(epd, SMILEY_FB, 50, 50)
+    display_icon(epd, SMILEY_FB, 90, 50)
+    display_icon(epd, SMILEY_FB, 130, 50)
     
-    epd.display()
-    sleep(3)
+    epd.display_then_wait_ms(3000)
     
     # Display checkerboard pattern
     print("Displaying pattern...")
     epd.fill(0)
     epd.text("Checkerboard:", 10, 10, 1)
     
-    pattern_data, width, height = create_simple_image()
+    # A plain bytearray is fine here: on SPIRAM-enabled ESP32 builds the
+    # MicroPython heap itself lives in PSRAM, so no special allocator is needed.
+    pattern_data = bytearray(PATTERN_ROW_BYTES * PATTERN_SIZE)
+    width, height = create_simple_image(pattern_data)
     pattern_fb = framebuf.FrameBuffer(pattern_data, width, height, framebuf.MONO_HLSB)
     epd.blit(pattern_fb, 100, 35)
     
-    epd.display()
-    sleep(3)
+    epd.display_then_wait_ms(3000)
     
     # Sleep display
     epd.sleep()
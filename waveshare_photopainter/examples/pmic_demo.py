@@ -6,22 +6,27 @@ Management IC on the Waveshare ESP32-S3 PhotoPainter board.
 """
 
 from machine import Pin, I2C
-from drivers.ed2208_gca import AXP2101
+from waveshare_photopainter.drivers.ed2208_gca import AXP2101
 from time import sleep
+from micropython import const
 
 # I2C configuration for AXP2101
 # Adjust these pins according to your actual hardware configuration
-I2C_SCL = 18
-I2C_SDA = 17
+I2C_SCL = const(18)
+I2C_SDA = const(17)
+
+# Set to True to list every device on the I2C bus (probes all addresses)
+DEBUG_I2C_SCAN = False
 
 def main():
     # Initialize I2C
     print("Initializing I2C bus...")
     i2c = I2C(0, scl=Pin(I2C_SCL), sda=Pin(I2C_SDA), freq=400000)
     
-    # Scan for I2C devices
-    devices = i2c.scan()
-    print(f"I2C devices found: {[hex(d) for d in devices]}")
+    # Scan for I2C devices (debugging only; the PMIC address is fixed)
+    if DEBUG_I2C_SCAN:
+        devices = i2c.scan()
+        print("I2C devices found:", *map(hex, devices))
     
     # Initialize AXP2101 PMIC
     print("Initializing AXP2101 PMIC...")
@@ -31,23 +36,25 @@ def main():
     pmic.init()
     print("PMIC initialized successfully!")
     
-    # Get and display status
+    # Get and display status (status and charging registers in one read)
     print("\n--- PMIC Status ---")
-    status = pmic.get_status()
+    block = pmic.read_status_block()
+    status = block[0]
+    charge_status = block[1]
     print(f"Status register: 0x{status:02X}")
     
-    # Check battery status
-    if pmic.is_battery_present():
+    # Check battery status (same bit tests as is_battery_present() and
+    # is_charging())
+    if status & 0x08:
         print("Battery: Connected")
-        if pmic.is_charging():
+        if (charge_status & 0x0F) in (0x01, 0x02):
             print("Battery: Charging")
         else:
             print("Battery: Not charging")
     else:
         print("Battery: Not connected")
     
-    # Get charging status
-    charge_status = pmic.get_charging_status()
+    # Show charging status
     print(f"Charging status: 0x{charge_status:02X}")
     
     # Enable display power
@@ -83,6 +90,17 @@ def main():
     pmic.enable_display_power()
     sleep(1)
     
+    # This demo only reports to the REPL. To show battery state on the
+    # e-paper as well, redraw just a small status window with a partial
+    # update rather than refreshing the whole panel, e.g.:
+    #
+    #     epd.rect(0, 0, 80, 16, 0, fill=True)
+    #     epd.text("BAT OK" if status & 0x08 else "NO BAT", 0, 4, 1)
+    #     epd.partial_display(0, 0, 80, 16)
+    #
+    # That sends 10 bytes x 16 rows = 160 bytes and runs the short partial
+    # waveform, instead of a 3904-byte full refresh.
+    
     print("\nPMIC demo complete!")
 
 if __name__ == "__main__":
@@ -8,39 +8,41 @@ Waveshare ESP32-S3 PhotoPainter using the configuration helper.
 from waveshare_photopainter.config import create_display
 from time import sleep
 
+def _text_block(epd, dirty, lines, x, y):
+    """Draw lines of text 20 px apart and grow [x0, y0, x1, y1] to cover them."""
+    epd.text_lines(lines, x, y, 1, 20)
+    dirty[0] = min(dirty[0], x)
+    dirty[1] = min(dirty[1], y)
+    dirty[2] = max(dirty[2], x + max(len(s) for s in lines) * 8)
+    dirty[3] = max(dirty[3], y + (len(lines) - 1) * 20 + 8)
+
 def main():
     # Create display with default configuration
     print("Initializing display with default configuration...")
     epd = create_display()
     
-    # Clear the display
-    print("Clearing display...")
-    epd.clear(0xFF)
-    epd.display()
-    sleep(1)
+    # Bounding box of the text drawn so far (x0, y0, x1, y1)
+    dirty = [epd.width, epd.height, 0, 0]
     
     # Show welcome message
     print("Displaying welcome message...")
     epd.fill(0)
-    epd.text("Quick Start!", 10, 10, 1)
-    epd.text("Waveshare", 10, 30, 1)
-    epd.text("ESP32-S3", 10, 50, 1)
-    epd.text("PhotoPainter", 10, 70, 1)
+    _text_block(epd, dirty, ("Quick Start!", "Waveshare", "ESP32-S3",
+                             "PhotoPainter"), 10, 10)
     
     # Draw a border
     epd.rect(5, 5, 240, 112, 1)
     
-    epd.display()
-    sleep(3)
+    epd.display_then_wait_ms(3000)
     
-    # Show system info
+    # Show system info. The border from the welcome screen is kept so that
+    # this scene only changes the text: erase the previous text and refresh
+    # just the union of old and new text.
     print("Displaying system info...")
-    epd.fill(0)
-    epd.text("Display Info:", 10, 10, 1)
-    epd.text(f"Size: {epd.width}x{epd.height}", 10, 30, 1)
-    epd.text("Type: E-Paper", 10, 50, 1)
-    epd.text("Model: ED2208-GCA", 10, 70, 1)
-    epd.display()
+    epd.rect(dirty[0], dirty[1], dirty[2] - dirty[0], dirty[3] - dirty[1], 0, fill=True)
+    _text_block(epd, dirty, ("Display Info:", f"Size: {epd.width}x{epd.height}",
+                             "Type: E-Paper", "Model: ED2208-GCA"), 10, 10)
+    epd.partial_display(dirty[0], dirty[1], dirty[2] - dirty[0], dirty[3] - dirty[1])
     sleep(3)
     
     # Put display to sleep